@@ -12,6 +12,7 @@ from models.database import (
     EmailTemplate, Settings, WebhookEvent, EmailSequenceConfig,
     SequenceStep, EmailSequence, ContactCampaignStatus
 )
+from utils.json_utils import dumps as json_dumps, loads as json_loads
 
 # Import blueprints
 from routes.auth import auth_bp
@@ -66,10 +67,17 @@ def create_app():
 
     # File upload configuration
     app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_CONTENT_LENGTH', '16777216'))  # 16MB default
+
+    # Pagination limits (see utils/pagination.py)
+    app.config['PAGINATION_MAX_OFFSET'] = int(os.getenv('PAGINATION_MAX_OFFSET', '10000'))
+    app.config['PAGINATION_MAX_PER_PAGE'] = int(os.getenv('PAGINATION_MAX_PER_PAGE', '200'))
+
     app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
         'pool_pre_ping': True,
         'pool_recycle': -1,
-        'echo': False
+        'echo': False,
+        'json_serializer': json_dumps,      # orjson for db.JSON columns
+        'json_deserializer': json_loads
     }
 
     # Admin credentials from environment
@@ -7,7 +7,9 @@ from datetime import datetime
 from sqlalchemy import func
 import uuid
 
-db = SQLAlchemy()
+# Keep attributes loaded after commit; request-scoped sessions don't need the reload SELECTs
+db = SQLAlchemy(session_options={'expire_on_commit': False})
+
 
 class Contact(db.Model):
     """Contact model for storing prospect information"""
@@ -245,6 +247,10 @@ class Email(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('idx_emails_campaign_contact', 'campaign_id', 'contact_id'),
+    )
+
     # Relationships
     responses = db.relationship('Response', backref='email', lazy='dynamic', cascade='all, delete-orphan')
     template = db.relationship('EmailTemplate', backref='emails')
@@ -284,6 +290,10 @@ class Response(db.Model):
     processed_at = db.Column(db.DateTime, default=datetime.utcnow)
     lead_score = db.Column(db.Integer)  # 0-10 scale
 
+    __table_args__ = (
+        db.Index('idx_responses_email_id', 'email_id'),
+    )
+
     def __repr__(self):
         return f'<Response {self.id} - {self.response_type}>'
 
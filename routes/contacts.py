@@ -10,8 +10,9 @@ import socket
 import tempfile
 from datetime import datetime, timedelta
 from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app, jsonify
+from sqlalchemy import insert
 from utils.decorators import login_required
-from utils.pagination import SimplePagination, MockPagination
+from utils.pagination import SimplePagination, PaginationTooDeepError, check_page_depth, empty_pagination, get_max_offset, paginate
 from models.database import db, Contact, Email, Campaign
 from services.emaillistverify_validator import create_emaillistverify_validator
 
@@ -92,6 +93,15 @@ def index():
     status_filter = request.args.get('status', '')
     sort_order = request.args.get('sort', '')
 
+    # Refuse deep offset pages before touching the database
+    try:
+        check_page_depth(page, per_page)
+    except PaginationTooDeepError as e:
+        current_app.logger.info(str(e))
+        flash('Page too deep — narrow your search or filters', 'warning')
+        return redirect(url_for('contacts.index', search=search, filter=filter_type,
+                                status=status_filter, sort=sort_order))
+
     # Build base query
     query = Contact.query
 
@@ -178,7 +188,7 @@ def index():
 
     print(f"=== CONTACTS WITH EMAIL COUNTS: {len(contacts)} ===")
 
-    pagination = SimplePagination(contacts, total, page, per_page)
+    pagination = SimplePagination(contacts, total, page, per_page, get_max_offset())
 
     # Calculate additional statistics efficiently with separate simple queries (SQLAlchemy version compatibility)
     total_contacts = Contact.query.count()
@@ -481,7 +491,7 @@ def leads():
         print(f"Leads error: {e}")
         import traceback
         print(f"Full traceback: {traceback.format_exc()}")
-        return render_template('leads.html', leads=[], pagination=MockPagination(), stats={})
+        return render_template('leads.html', leads=[], pagination=empty_pagination(), stats={})
 
 
 @contacts_bp.route('/emails/<status>')
@@ -521,15 +531,12 @@ def email_management(status):
             # Invalid status, default to 'all'
             status = 'all'
         
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination and ordering
-        query_results = query.order_by(Email.sent_at.desc()).offset((page-1) * per_page).limit(per_page).all()
+        # Apply ordering and pagination (page rows and total in one query)
+        pagination = paginate(query.order_by(Email.sent_at.desc()), page, per_page)
 
         # Convert query results to the format expected by template
         emails = []
-        for result in query_results:
+        for result in pagination.items:
             if isinstance(result, tuple):
                 # If query returns (Email, Contact, Campaign) tuple
                 if len(result) == 3:
@@ -555,7 +562,7 @@ def email_management(status):
                     'campaign': result.campaign
                 })
 
-        pagination = SimplePagination(emails, total, page, per_page)
+        pagination = SimplePagination(emails, pagination.total, pagination.page, per_page, get_max_offset())
         
         # Calculate status counts for the filter buttons
         status_counts = {}
@@ -588,7 +595,12 @@ def email_management(status):
                              current_status=status,
                              status_counts=status_counts,
                              config=config)
-                             
+
+    except PaginationTooDeepError as e:
+        current_app.logger.info(str(e))
+        flash('Page too deep — narrow your search or filters', 'warning')
+        return redirect(url_for('contacts.email_management', status=status))
+
     except Exception as e:
         import traceback
         print(f"Email management error: {e}")
@@ -603,7 +615,7 @@ def email_management(status):
 
         return render_template('email_management.html',
                              emails=[],
-                             pagination=MockPagination(),
+                             pagination=empty_pagination(),
                              current_status=status,
                              status_counts={},
                              config=config)
@@ -836,28 +848,22 @@ def upload_csv():
 
         current_app.logger.info(f"Processing {len(rows_to_process)} validated contacts for upload")
 
-        # STEP 5: Batch insert all new contacts
-        new_contacts = []
-        for contact_data in rows_to_process:
-            new_contacts.append(Contact(**contact_data))
-        
-        # 3. Batch insert all new contacts in smaller chunks to avoid memory issues
+        # STEP 5: Batch insert all new contacts in smaller chunks to avoid memory issues
         new_contact_ids = []
-        if new_contacts:
+        unique_domains = set()
+        if rows_to_process:
             # Process in batches of 50 to avoid memory/timeout issues
             batch_size = 50
-            for i in range(0, len(new_contacts), batch_size):
-                batch = new_contacts[i:i + batch_size]
+            for i in range(0, len(rows_to_process), batch_size):
+                batch = rows_to_process[i:i + batch_size]
                 try:
-                    db.session.bulk_save_objects(batch)
+                    # ORM bulk INSERT (insertmanyvalues) returns the new IDs and domains directly
+                    result = db.session.execute(insert(Contact).returning(Contact.id, Contact.domain), batch)
+                    batch_rows = result.all()
                     db.session.commit()
 
-                    # Get the inserted contact IDs for this batch
-                    batch_contact_ids = [
-                        contact.id for contact in
-                        Contact.query.filter(Contact.email.in_([c.email for c in batch])).all()
-                    ]
-                    new_contact_ids.extend(batch_contact_ids)
+                    new_contact_ids.extend(row.id for row in batch_rows)
+                    unique_domains.update(row.domain for row in batch_rows if row.domain)
 
                 except Exception as batch_error:
                     current_app.logger.error(f"Batch insert failed for batch {i//batch_size + 1}: {batch_error}")
@@ -919,7 +925,6 @@ def upload_csv():
 
         # Background scanning removed - FlawTrack/breach detection no longer used
         scan_job_id = None
-        unique_domains = set(c.domain for c in new_contacts if c.domain)
         
         # 5. Return success response
         message_parts = []
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test CSV Contact Upload
+Posts CSV files to /contacts/upload/csv against an in-memory database
+"""
+import io
+import os
+import sys
+
+# Add project directory to path
+basedir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, basedir)
+
+# Use the regex fallback instead of calling EmailListVerify
+os.environ['EMAILLISTVERIFY_ENABLED'] = 'false'
+
+from flask import Flask
+from models.database import db, Contact
+from routes.contacts import contacts_bp
+
+CSV_CONTENT = (
+    "email,first_name,company\n"
+    "alice@alpha.com,alice,Alpha\n"
+    "bob@alpha.com,bob,Alpha\n"
+    "carol@beta.io,carol,Beta\n"
+    "not-an-email,dave,Nowhere\n"
+)
+
+
+def create_test_app():
+    """Minimal app with the contacts blueprint and an in-memory database"""
+    app = Flask(__name__, template_folder=os.path.join(basedir, 'templates'))
+    app.config['SECRET_KEY'] = 'test'
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    app.register_blueprint(contacts_bp)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def upload(client, content):
+    """POST a CSV file and return the JSON response"""
+    data = {'file': (io.BytesIO(content.encode()), 'contacts.csv')}
+    response = client.post('/contacts/upload/csv', data=data, content_type='multipart/form-data')
+    return response.get_json()
+
+
+def test_csv_upload():
+    """Upload new contacts, then the same file again as duplicates"""
+    print("CSV Upload Testing")
+    print("=" * 40)
+
+    app = create_test_app()
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['logged_in'] = True
+
+    failures = 0
+
+    # 1. First upload creates contacts and reports the domains it found
+    result = upload(client, CSV_CONTENT)
+    summary = result.get('summary', {}) if result else {}
+    if result and result['success'] and summary.get('contacts_created') == 3 and summary.get('domains_found') == 2:
+        print(f"[OK] {result['message']}")
+    else:
+        print(f"[ERROR] Unexpected first upload response: {result}")
+        failures += 1
+
+    with app.app_context():
+        domains = sorted(row.domain for row in db.session.query(Contact.domain).distinct())
+    if domains == ['alpha.com', 'beta.io']:
+        print(f"[OK] Stored contact domains: {domains}")
+    else:
+        print(f"[ERROR] Unexpected stored domains: {domains}")
+        failures += 1
+
+    # 2. Uploading the same file again only skips duplicates
+    result = upload(client, CSV_CONTENT)
+    summary = result.get('summary', {}) if result else {}
+    if result and result['success'] and summary.get('duplicates_skipped') == 3 and summary.get('contacts_created') == 0:
+        print(f"[OK] {result['message']}")
+    else:
+        print(f"[ERROR] Unexpected duplicate upload response: {result}")
+        failures += 1
+
+    print("\n=== TEST COMPLETE ===" if not failures else f"\n=== {failures} CHECK(S) FAILED ===")
+    return failures == 0
+
+
+if __name__ == "__main__":
+    success = test_csv_upload()
+    sys.exit(0 if success else 1)
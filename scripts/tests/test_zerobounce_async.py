@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test Async ZeroBounce Validation
+Runs AsyncZeroBounceValidator against a local stub of the ZeroBounce /validate endpoint
+"""
+import asyncio
+import os
+import sys
+import threading
+
+from aiohttp import web
+
+# Add project directory to path
+basedir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, basedir)
+
+os.environ['ZEROBOUNCE_ENABLED'] = 'true'
+os.environ['ZEROBOUNCE_API_KEY'] = 'test-key'
+
+from services.zerobounce_validator_async import AsyncZeroBounceValidator
+
+STUB_PORT = 8765
+request_count = 0
+
+
+async def stub_validate(request):
+    """Answer like ZeroBounce: 'invalid' for bounce@ addresses, 'valid' otherwise"""
+    global request_count
+    request_count += 1
+    email = request.query['email']
+    account, domain = email.split('@')
+    return web.json_response({
+        'address': email,
+        'status': 'invalid' if account == 'bounce' else 'valid',
+        'sub_status': '',
+        'account': account,
+        'domain': domain,
+        'mx_found': 'true'
+    })
+
+
+def start_stub_server():
+    """Serve the stub on its own event loop so sync and async clients can both call it"""
+    loop = asyncio.new_event_loop()
+    app = web.Application()
+    app.router.add_get('/v2/validate', stub_validate)
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, '127.0.0.1', STUB_PORT).start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
+
+def test_zerobounce_async():
+    """Check sync compatibility, ordering, caching and reuse across event loops"""
+    print("Async ZeroBounce Validation Testing")
+    print("=" * 40)
+
+    start_stub_server()
+    validator = AsyncZeroBounceValidator(concurrency=4)
+    validator.base_url = f'http://127.0.0.1:{STUB_PORT}/v2'
+    emails = [f'user{i}@example.com' for i in range(10)] + ['bounce@example.com']
+    failures = 0
+
+    # 1. The inherited synchronous API still returns a result, not a coroutine
+    result = validator.validate_email('user0@example.com')
+    if isinstance(result, dict) and result['validation_method'] == 'zerobounce_api':
+        print("[OK] Sync validate_email returns a result")
+    else:
+        print(f"[ERROR] Sync validate_email returned {result!r}")
+        failures += 1
+
+    # 2. Batch results come back in input order
+    results = asyncio.run(validator.avalidate_many(emails))
+    statuses = [r['status'] for r in results]
+    if statuses == ['valid'] * 10 + ['invalid']:
+        print(f"[OK] Validated {len(results)} emails in order")
+    else:
+        print(f"[ERROR] Unexpected statuses: {statuses}")
+        failures += 1
+
+    # 3. A second asyncio.run (new event loop) reuses the cache without lock errors
+    before = request_count
+    try:
+        asyncio.run(validator.avalidate_many(emails))
+        if request_count == before:
+            print("[OK] Second run on a new loop served from cache")
+        else:
+            print(f"[ERROR] Second run made {request_count - before} API calls")
+            failures += 1
+    except RuntimeError as e:
+        print(f"[ERROR] Second run failed: {e}")
+        failures += 1
+
+    print("\n=== TEST COMPLETE ===" if not failures else f"\n=== {failures} CHECK(S) FAILED ===")
+    return failures == 0
+
+
+if __name__ == "__main__":
+    success = test_zerobounce_async()
+    sys.exit(0 if success else 1)
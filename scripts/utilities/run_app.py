@@ -13,14 +13,12 @@ This script will:
 4. Gracefully shutdown all processes when stopped
 """
 
-import os
+import importlib.util
 import sys
 import time
 import signal
 import subprocess
-import threading
 import atexit
-from pathlib import Path
 
 # Global process tracking
 processes = []
@@ -29,8 +27,6 @@ celery_process = None
 
 def cleanup_processes():
     """Clean up all spawned processes"""
-    global processes, redis_process, celery_process
-
     print("\n🛑 Shutting down SalesBreachPro...")
 
     # Stop Celery worker
@@ -127,6 +123,10 @@ def start_embedded_redis():
         print(f"  ❌ Error starting Redis: {e}")
         return False
 
+def celery_app_available():
+    """Check that the celery_app module the worker imports is present"""
+    return importlib.util.find_spec('celery_app') is not None
+
 def start_celery_worker():
     """Start Celery worker in background"""
     global celery_process
@@ -146,7 +146,7 @@ from celery_app import celery_app
 celery_app.worker_main([
     "worker",
     "--loglevel=warning",  # Reduce log noise
-    "--concurrency=1",
+    "--concurrency=1",  # Single worker keeps the external API call cadence
     "--queues=domain_scanning,celery",
     "--hostname=worker@salesbreachpro"
 ])
@@ -222,7 +222,9 @@ def main():
 
     # 2. Start Celery Worker
     print("\n2️⃣ Setting up Celery worker...")
-    if not start_celery_worker():
+    if not celery_app_available():
+        print("  ⚠️  celery_app.py not found - skipping Celery worker (background tasks disabled)")
+    elif not start_celery_worker():
         print("❌ Failed to start Celery worker. Exiting.")
         cleanup_processes()
         sys.exit(1)
@@ -4,12 +4,16 @@ Handles automatic domain scanning after contact uploads
 """
 
 import logging
+import re
 from datetime import datetime
 from typing import List, Dict, Set
 from models.database import db, Contact
 
 logger = logging.getLogger(__name__)
 
+# Domain part of an address: text after the first '@' on a line, up to the next '@' or whitespace
+EMAIL_DOMAIN_PATTERN = re.compile(r'^[^@\n]*@([^@\s]+)', re.MULTILINE)
+
 def trigger_domain_scanning_after_upload(uploaded_contacts: List[Dict], upload_batch_id: str = None) -> Dict:
     """
     Trigger domain scanning for newly uploaded contacts
@@ -116,15 +120,11 @@ def extract_unique_domains_from_contacts(contacts: List[Dict]) -> List[str]:
     Returns:
         List of unique domain names
     """
-    domains = set()
-
-    for contact in contacts:
-        email = contact.get('email', '').strip().lower()
-        if email and '@' in email:
-            domain = email.split('@')[1]
-            domains.add(domain)
+    # Parse every address in one regex pass over a newline-joined, lowercased blob
+    emails = '\n'.join(contact.get('email') or '' for contact in contacts).lower()
+    domains = set(EMAIL_DOMAIN_PATTERN.findall(emails))
 
-    return sorted(list(domains))
+    return sorted(domains)
 
 def filter_domains_needing_scan(domains: List[str]) -> List[str]:
     """
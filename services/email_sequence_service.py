@@ -672,7 +672,7 @@ class EmailSequenceService:
             return {
                 'subject': subject,
                 'body': body,
-                'html_body': template.email_body_html or body.replace('\\n', '<br>'),
+                'html_body': template.email_body_html or body.replace('\n', '<br>'),
                 'template_vars': template_vars
             }
 
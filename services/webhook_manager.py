@@ -4,12 +4,30 @@ Handles dynamic webhook registration with Brevo API
 """
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 import brevo_python
 from brevo_python.rest import ApiException
 
 logger = logging.getLogger(__name__)
 
+# Brevo WebhooksApi clients keyed by API key, shared across WebhookManager
+# instances so each one reuses the same urllib3 connection pool
+_webhooks_api_cache: Dict[str, brevo_python.WebhooksApi] = {}
+
+
+def _get_webhooks_api(api_key: str) -> brevo_python.WebhooksApi:
+    """Return the shared WebhooksApi client for an API key, creating it on first use"""
+    webhooks_api = _webhooks_api_cache.get(api_key)
+    if webhooks_api is None:
+        configuration = brevo_python.Configuration()
+        configuration.api_key['api-key'] = api_key
+        api_client = brevo_python.ApiClient(configuration)
+        webhooks_api = brevo_python.WebhooksApi(api_client)
+        _webhooks_api_cache[api_key] = webhooks_api
+    return webhooks_api
+
+
 class WebhookManager:
     """Manages webhook registration and updates with Brevo"""
 
@@ -28,13 +46,8 @@ class WebhookManager:
             logger.error("No Brevo API key found for webhook management")
             return
 
-        # Configure API client
-        configuration = brevo_python.Configuration()
-        configuration.api_key['api-key'] = self.api_key
-        api_client = brevo_python.ApiClient(configuration)
-
-        # Initialize webhook API
-        self.webhooks_api = brevo_python.WebhooksApi(api_client)
+        # Initialize webhook API (shared per API key)
+        self.webhooks_api = _get_webhooks_api(self.api_key)
 
         logger.info("Webhook Manager initialized successfully")
 
@@ -133,20 +146,28 @@ class WebhookManager:
             logger.error(error_msg)
             return False, error_msg
 
-    def update_webhook_url(self, webhook_id: int, new_url: str) -> Tuple[bool, str]:
-        """Update an existing webhook URL"""
+    def update_webhook_url(self, webhook_id: int, new_url: str, description: Optional[str] = None,
+                           events: Optional[List[str]] = None) -> Tuple[bool, str]:
+        """Update an existing webhook URL
+
+        Pass the webhook's description and events when already known (e.g. from
+        list_existing_webhooks) to skip fetching the webhook before the update.
+        """
         try:
             if not self.api_key:
                 return False, "No API key configured"
 
-            # Get existing webhook details
-            existing_webhook = self.webhooks_api.get_webhook(webhook_id)
+            if description is None and events is None:
+                # Get existing webhook details
+                existing_webhook = self.webhooks_api.get_webhook(webhook_id)
+                description = existing_webhook.description
+                events = existing_webhook.events
 
             # Update webhook request
             update_webhook = brevo_python.UpdateWebhook(
                 url=new_url,
-                description=existing_webhook.description,
-                events=existing_webhook.events
+                description=description,
+                events=events
             )
 
             # Update the webhook
@@ -195,15 +216,20 @@ class WebhookManager:
         }
 
         try:
-            current_webhook_url = self.get_webhook_url()
-            existing_webhooks = self.list_existing_webhooks()
-
-            # Check if we already have a webhook for our URL
-            matching_webhook = None
+            # Listing webhooks is a Brevo round-trip; start it in the background while
+            # the URL and secret are resolved locally. Settings reads/writes stay on this
+            # thread because the database session is bound to the current app context.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                existing_future = executor.submit(self.list_existing_webhooks)
+                current_webhook_url = self.get_webhook_url()
+                webhook_secret = self.get_webhook_secret()
+                existing_webhooks = existing_future.result()
+
+            # Check if we already have a webhook for our URL (first registration wins)
+            webhooks_by_key = {}
             for webhook in existing_webhooks:
-                if webhook['url'] == current_webhook_url and webhook['type'] == 'transactional':
-                    matching_webhook = webhook
-                    break
+                webhooks_by_key.setdefault((webhook['url'], webhook['type']), webhook)
+            matching_webhook = webhooks_by_key.get((current_webhook_url, 'transactional'))
 
             if matching_webhook and not force_recreate:
                 results['messages'].append(f"Webhook already exists for {current_webhook_url}")
@@ -230,7 +256,7 @@ class WebhookManager:
             try:
                 from models.database import Settings
                 Settings.set_setting('brevo_webhook_url', current_webhook_url, 'Current Brevo webhook URL')
-                Settings.set_setting('brevo_webhook_secret', self.get_webhook_secret(), 'Brevo webhook secret for signature verification')
+                Settings.set_setting('brevo_webhook_secret', webhook_secret, 'Brevo webhook secret for signature verification')
             except Exception as e:
                 results['errors'].append(f"Error updating settings: {e}")
 
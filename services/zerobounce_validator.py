@@ -5,14 +5,24 @@ Integrates with ZeroBounce API for high-quality email validation
 
 import os
 import requests
-import json
 import logging
-from datetime import datetime, timedelta
 from typing import Dict, Optional
-from models.database import db
+from utils.json_utils import loads
 
 logger = logging.getLogger(__name__)
 
+
+_session = None
+
+
+def _get_session() -> requests.Session:
+    """Shared keep-alive session so connections (and DNS lookups) are reused"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
 class ZeroBounceValidator:
     """ZeroBounce API integration for email validation"""
 
@@ -36,7 +46,7 @@ class ZeroBounceValidator:
 
         try:
             # Make API call to ZeroBounce
-            response = requests.get(
+            response = _get_session().get(
                 f"{self.base_url}/validate",
                 params={
                     'api_key': self.api_key,
@@ -47,7 +57,7 @@ class ZeroBounceValidator:
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = loads(response.content)
                 return self._process_zerobounce_response(data)
             else:
                 logger.error(f"ZeroBounce API error: {response.status_code} - {response.text}")
@@ -179,14 +189,14 @@ class ZeroBounceValidator:
             return None
 
         try:
-            response = requests.get(
+            response = _get_session().get(
                 f"{self.base_url}/getcredits",
                 params={'api_key': self.api_key},
                 timeout=self.timeout
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = loads(response.content)
                 credits = data.get('Credits', 0)
                 logger.info(f"ZeroBounce credits remaining: {credits}")
                 return credits
@@ -205,7 +215,7 @@ class ZeroBounceValidator:
 
         try:
             # Test with a simple validation call
-            response = requests.get(
+            response = _get_session().get(
                 f"{self.base_url}/validate",
                 params={
                     'api_key': self.api_key,
@@ -0,0 +1,131 @@
+"""
+Async ZeroBounce Email Validation Service
+Validates many emails concurrently over a bounded aiohttp connection pool
+"""
+
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional
+
+import aiohttp
+
+from services.zerobounce_validator import ZeroBounceValidator
+from utils.json_utils import loads
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncZeroBounceValidator(ZeroBounceValidator):
+    """
+    Async ZeroBounce client sharing response handling with ZeroBounceValidator
+
+    Coroutines use their own names (avalidate_email, avalidate_many) so the
+    inherited synchronous validate_email keeps working wherever a
+    ZeroBounceValidator is expected.
+    """
+
+    def __init__(self, concurrency: int = 32):
+        super().__init__()
+        self.concurrency = concurrency
+        self._cache: Dict[str, Dict] = {}
+        self._cache_lock: Optional[asyncio.Lock] = None
+        self._cache_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_cache_lock(self) -> asyncio.Lock:
+        """Cache lock for the running event loop (validate_emails starts a new loop per call)"""
+        loop = asyncio.get_running_loop()
+        if self._cache_lock is None or self._cache_lock_loop is not loop:
+            self._cache_lock = asyncio.Lock()
+            self._cache_lock_loop = loop
+        return self._cache_lock
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a pooled client session for a batch of validations"""
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            use_dns_cache=True,
+            ttl_dns_cache=300,  # Resolve api.zerobounce.net at most every 5 minutes
+            keepalive_timeout=60
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    async def avalidate_email(self, email: str, session: Optional[aiohttp.ClientSession] = None) -> Dict:
+        """
+        Validate email using ZeroBounce API
+        Returns standardized validation result
+        """
+        if not self.enabled:
+            return self._fallback_validation(email)
+
+        async with self._get_cache_lock():
+            cached = self._cache.get(email)
+        if cached is not None:
+            return cached
+
+        if session is None:
+            async with self._create_session() as own_session:
+                return await self.avalidate_email(email, own_session)
+
+        try:
+            async with session.get(
+                f"{self.base_url}/validate",
+                params={
+                    'api_key': self.api_key,
+                    'email': email,
+                    'ip_address': ''  # Optional IP address
+                }
+            ) as response:
+                content = await response.read()
+
+                if response.status != 200:
+                    logger.error(f"ZeroBounce API error: {response.status} - {content[:500]!r}")
+                    return self._fallback_validation(email)
+
+            result = self._process_zerobounce_response(loads(content))
+
+            async with self._get_cache_lock():
+                self._cache[email] = result
+            return result
+
+        except asyncio.TimeoutError:
+            logger.warning(f"ZeroBounce API timeout for {email}")
+            return self._fallback_validation(email)
+        except aiohttp.ClientError as e:
+            logger.error(f"ZeroBounce API request failed for {email}: {str(e)}")
+            return self._fallback_validation(email)
+        except Exception as e:
+            logger.error(f"ZeroBounce validation failed for {email}: {str(e)}")
+            return self._fallback_validation(email)
+
+    async def avalidate_many(self, emails: Iterable[str], concurrency: Optional[int] = None) -> List[Dict]:
+        """
+        Validate a list of emails concurrently
+        Results are returned in the same order as the input
+        """
+        emails = list(emails)
+        if not self.enabled:
+            return [self._fallback_validation(email) for email in emails]
+
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async with self._create_session() as session:
+            async def _validate(email: str) -> Dict:
+                async with semaphore:
+                    return await self.avalidate_email(email, session)
+
+            return await asyncio.gather(*(_validate(email) for email in emails))
+
+
+def validate_emails(emails: Iterable[str], concurrency: int = 32) -> List[Dict]:
+    """Validate emails from synchronous code (Flask views, Celery tasks)"""
+    validator = AsyncZeroBounceValidator(concurrency=concurrency)
+    return asyncio.run(validator.avalidate_many(emails))
+
+
+# Factory function for easy integration
+def create_async_zerobounce_validator(concurrency: int = 32):
+    """Create async ZeroBounce validator instance"""
+    return AsyncZeroBounceValidator(concurrency=concurrency)
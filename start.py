@@ -7,6 +7,43 @@ This is the simplest way to run SalesBreachPro with automatic background scannin
 No Redis or Celery setup required - the system will automatically choose the best available backend.
 """
 
+import os
+
+
+def run_gunicorn():
+    """Serve the app with gunicorn (not available on Windows)"""
+    from gunicorn.app.base import BaseApplication
+
+    class SalesBreachProApplication(BaseApplication):
+        def load_config(self):
+            # A single worker process keeps one background scheduler running;
+            # request concurrency comes from the worker's thread pool instead.
+            self.cfg.set('bind', '0.0.0.0:5000')
+            self.cfg.set('workers', 1)
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('threads', (os.cpu_count() or 1) * 2 + 1)
+            self.cfg.set('timeout', 120)
+
+        def load(self):
+            from app import create_app
+            return create_app()
+
+    SalesBreachProApplication().run()
+
+
+def run_development_server():
+    """Fallback to the threaded Werkzeug server"""
+    from app import create_app
+    app = create_app()
+
+    app.run(
+        host='0.0.0.0',
+        port=5000,
+        debug=False,
+        threaded=True
+    )
+
+
 if __name__ == '__main__':
     print("Starting SalesBreachPro...")
     print("=================================")
@@ -16,14 +53,11 @@ if __name__ == '__main__':
     print("=================================")
 
     try:
-        from app import create_app
-        app = create_app()
-
-        app.run(
-            host='0.0.0.0',
-            port=5000,
-            debug=False
-        )
+        try:
+            run_gunicorn()
+        except ImportError:
+            print("gunicorn not available, using the built-in development server")
+            run_development_server()
     except KeyboardInterrupt:
         print("\nSalesBreachPro stopped")
     except Exception as e:
@@ -15,12 +15,23 @@ def update_database():
         print(f"Database {db_path} not found!")
         return False
 
-    conn = sqlite3.connect(db_path)
+    # Manage transactions explicitly so all DDL below commits (and fsyncs) once
+    conn = sqlite3.connect(db_path, isolation_level=None)
     cursor = conn.cursor()
 
     try:
         print("=== UPDATING DATABASE FOR TEMPLATE VARIANTS ===")
 
+        # journal_mode is persistent, so the app also runs on WAL afterwards
+        cursor.executescript('''
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-262144;
+        ''')
+
+        cursor.execute('BEGIN IMMEDIATE')
+
         # 1. Create template_variants table
         print("\n1. Creating template_variants table...")
         cursor.execute('''
@@ -52,7 +63,7 @@ def update_database():
         # 2. Update emails table
         print("\n2. Updating emails table...")
         cursor.execute("PRAGMA table_info(emails)")
-        columns = [column[1] for column in cursor.fetchall()]
+        columns = {column[1] for column in cursor.fetchall()}
 
         if 'template_variant_id' not in columns:
             print("   Adding template_variant_id column...")
@@ -63,7 +74,7 @@ def update_database():
         # 3. Update campaigns table
         print("\n3. Updating campaigns table...")
         cursor.execute("PRAGMA table_info(campaigns)")
-        campaign_columns = [column[1] for column in cursor.fetchall()]
+        campaign_columns = {column[1] for column in cursor.fetchall()}
 
         if 'variant_testing_enabled' not in campaign_columns:
             print("   Adding variant_testing_enabled column...")
@@ -87,6 +98,16 @@ def update_database():
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_template_variants_active ON template_variants(is_active)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_emails_template_variant_id ON emails(template_variant_id)')
 
+        # Indexes for campaign/contact cleanup and domain lookups.
+        # email_sequences and contact_campaign_status are already covered by their
+        # (campaign_id, contact_id, ...) unique constraints.
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_emails_campaign_contact ON emails(campaign_id, contact_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_responses_email_id ON responses(email_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS ix_contacts_domain ON contacts(domain)')
+
+        # Refresh planner statistics so the new indexes are used
+        cursor.execute('ANALYZE')
+
         # Commit all changes
         conn.commit()
         print("\n✅ Database updated successfully!")
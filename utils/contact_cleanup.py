@@ -2,7 +2,8 @@
 Contact Cleanup Utilities for SalesBreachPro
 Functions to completely clean contact data for fresh campaign testing
 """
-from models.database import db, Contact, Email, EmailSequence, Response, ContactCampaignStatus
+from models.database import db, Contact, Email, EmailSequence, Response, ContactCampaignStatus, WebhookEvent
+from sqlalchemy import and_, select
 from typing import List, Optional
 
 def deep_clean_contact_campaign_data(contact_id: int, campaign_id: int) -> dict:
@@ -35,22 +36,27 @@ def deep_clean_contact_campaign_data(contact_id: int, campaign_id: int) -> dict:
         cleanup_results['sequences_deleted'] = sequences_deleted
         print(f"  - Deleted {sequences_deleted} email sequences")
 
-        # 2. Find and delete all Email records for this contact in this campaign
-        emails = Email.query.filter_by(campaign_id=campaign_id, contact_id=contact_id).all()
+        # 2. Delete all Email records (and their responses first) for this contact in this campaign
+        email_ids = select(Email.id).filter_by(campaign_id=campaign_id, contact_id=contact_id)
 
-        total_responses_deleted = 0
-        for email in emails:
-            # Delete any responses associated with this email first
-            responses_deleted = Response.query.filter_by(email_id=email.id).delete()
-            total_responses_deleted += responses_deleted
+        responses_deleted = Response.query.filter(
+            Response.email_id.in_(email_ids)
+        ).delete(synchronize_session=False)
 
-            # Delete the email record
-            db.session.delete(email)
+        # Keep webhook events but detach them, as the ORM delete did via Email.webhook_events
+        WebhookEvent.query.filter(
+            WebhookEvent.email_id.in_(email_ids)
+        ).update({WebhookEvent.email_id: None}, synchronize_session=False)
 
-        cleanup_results['emails_deleted'] = len(emails)
-        cleanup_results['responses_deleted'] = total_responses_deleted
-        print(f"  - Deleted {len(emails)} email records")
-        print(f"  - Deleted {total_responses_deleted} response records")
+        emails_deleted = Email.query.filter_by(
+            campaign_id=campaign_id,
+            contact_id=contact_id
+        ).delete(synchronize_session=False)
+
+        cleanup_results['emails_deleted'] = emails_deleted
+        cleanup_results['responses_deleted'] = responses_deleted
+        print(f"  - Deleted {emails_deleted} email records")
+        print(f"  - Deleted {responses_deleted} response records")
 
         # 3. Delete ContactCampaignStatus record if exists
         campaign_status = ContactCampaignStatus.query.filter_by(
@@ -124,6 +130,7 @@ def bulk_clean_campaign_contacts(campaign_id: int, contact_ids: Optional[List[in
     """
     Clean multiple contacts from a campaign at once.
     If contact_ids is None, cleans ALL contacts from the campaign.
+    All cleanup runs as set-based deletes in a single transaction.
     """
     try:
         from models.database import Campaign
@@ -140,35 +147,71 @@ def bulk_clean_campaign_contacts(campaign_id: int, contact_ids: Optional[List[in
         results = {
             'success': True,
             'campaign_name': campaign.name,
-            'contacts_processed': 0,
+            'contacts_processed': len(contact_ids),
             'contacts_cleaned': 0,
+            'sequences_deleted': 0,
+            'emails_deleted': 0,
+            'responses_deleted': 0,
+            'campaign_statuses_deleted': 0,
+            'contact_fields_reset': 0,
             'errors': [],
             'details': []
         }
 
-        for contact_id in contact_ids:
-            try:
-                cleanup_result = deep_clean_contact_campaign_data(contact_id, campaign_id)
-                results['contacts_processed'] += 1
+        contacts = db.session.query(Contact.id, Contact.email).filter(Contact.id.in_(contact_ids)).all()
+        found_ids = [contact.id for contact in contacts]
+
+        missing_ids = set(contact_ids) - set(found_ids)
+        for contact_id in missing_ids:
+            results['errors'].append(f"Failed to clean contact {contact_id}: Contact not found")
+
+        if found_ids:
+            campaign_emails = and_(Email.campaign_id == campaign_id, Email.contact_id.in_(found_ids))
 
-                if cleanup_result['success']:
-                    results['contacts_cleaned'] += 1
-                    results['details'].append({
-                        'contact_id': contact_id,
-                        'contact_email': cleanup_result.get('contact_email', 'unknown'),
-                        'cleanup_summary': cleanup_result
-                    })
-                else:
-                    results['errors'].append(f"Failed to clean contact {contact_id}: {cleanup_result.get('error', 'unknown error')}")
+            results['sequences_deleted'] = EmailSequence.query.filter(
+                EmailSequence.campaign_id == campaign_id,
+                EmailSequence.contact_id.in_(found_ids)
+            ).delete(synchronize_session=False)
 
-            except Exception as e:
-                results['errors'].append(f"Error cleaning contact {contact_id}: {str(e)}")
+            results['responses_deleted'] = Response.query.filter(
+                Response.email_id.in_(select(Email.id).where(campaign_emails))
+            ).delete(synchronize_session=False)
+
+            # Detach webhook events so they don't point at deleted (and reusable) email ids
+            WebhookEvent.query.filter(
+                WebhookEvent.email_id.in_(select(Email.id).where(campaign_emails))
+            ).update({WebhookEvent.email_id: None}, synchronize_session=False)
+
+            results['emails_deleted'] = Email.query.filter(campaign_emails).delete(synchronize_session=False)
+
+            results['campaign_statuses_deleted'] = ContactCampaignStatus.query.filter(
+                ContactCampaignStatus.campaign_id == campaign_id,
+                ContactCampaignStatus.contact_id.in_(found_ids)
+            ).delete(synchronize_session=False)
+
+            # Reset tracking fields for contacts that are not in any other campaign
+            results['contact_fields_reset'] = Contact.query.filter(
+                Contact.id.in_(found_ids),
+                Contact.id.not_in(select(Email.contact_id).where(Email.campaign_id != campaign_id))
+            ).update({
+                Contact.last_contacted_at: None,
+                Contact.last_contacted: None
+            }, synchronize_session=False)
+
+            db.session.commit()
+
+        results['contacts_cleaned'] = len(found_ids)
+        results['details'] = [
+            {'contact_id': contact.id, 'contact_email': contact.email}
+            for contact in contacts
+        ]
 
         print(f"✓ Bulk cleanup completed: {results['contacts_cleaned']}/{results['contacts_processed']} contacts cleaned")
 
         return results
 
     except Exception as e:
+        db.session.rollback()
         return {'success': False, 'error': str(e)}
 
 
@@ -2,117 +2,64 @@
 Database Seeder - Creates realistic dummy data for immediate UI functionality
 No placeholders - everything should work with real data from day 1
 """
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta
 from models.database import (
     db, EmailSequenceConfig, SequenceStep, EmailTemplate, Campaign, 
     Contact, EmailSequence, ContactCampaignStatus, Email, Settings
 )
+import logging
 import random
-
-class DatabaseSeeder:
-    """Creates realistic dummy data for working system"""
-    
-    def __init__(self):
-        self.sequence_configs = {}
-        self.templates = {}
-        self.campaigns = {}
-        self.contacts = []
-    
-    def seed_all(self):
-        """Seed all data for working system"""
-        print("Starting database seeding...")
-        
-        self.create_sequence_configs()
-        self.create_template_library()
-        self.create_demo_campaigns() 
-        self.create_sample_contacts()
-        self.create_email_sequences()
-        self.create_sample_settings()
-        
-        db.session.commit()
-        print("Database seeding completed!")
-        
-        self.print_summary()
-    
-    def create_sequence_configs(self):
-        """Create realistic sequence timing configurations"""
-        print("Creating email sequence configurations...")
-        
-        configs = [
-            {
-                'name': 'Standard Follow-up Sequence',
-                'description': 'Default 5-email sequence with proven timing - most popular choice',
-                'steps': [
-                    {'step_number': 0, 'delay_days': 0, 'step_name': 'Initial Outreach'},
-                    {'step_number': 1, 'delay_days': 2, 'step_name': 'First Follow-up'},
-                    {'step_number': 2, 'delay_days': 5, 'step_name': 'Second Follow-up'},
-                    {'step_number': 3, 'delay_days': 12, 'step_name': 'Third Follow-up'},
-                    {'step_number': 4, 'delay_days': 26, 'step_name': 'Final Follow-up'}
-                ]
-            },
-            {
-                'name': 'Aggressive Follow-up Sequence',
-                'description': 'Fast-paced 7-email sequence for urgent campaigns and high-priority prospects',
-                'steps': [
-                    {'step_number': 0, 'delay_days': 0, 'step_name': 'Urgent Alert'},
-                    {'step_number': 1, 'delay_days': 1, 'step_name': 'Quick Follow-up'},
-                    {'step_number': 2, 'delay_days': 3, 'step_name': 'Persistence Push'},
-                    {'step_number': 3, 'delay_days': 7, 'step_name': 'Week Check-in'},
-                    {'step_number': 4, 'delay_days': 14, 'step_name': 'Final Push'},
-                    {'step_number': 5, 'delay_days': 21, 'step_name': 'Closing Window'},
-                    {'step_number': 6, 'delay_days': 30, 'step_name': 'Archive Notice'}
-                ]
-            },
-            {
-                'name': 'Gentle Nurture Sequence',
-                'description': 'Relationship-building sequence with extended timing for long-term prospects',
-                'steps': [
-                    {'step_number': 0, 'delay_days': 0, 'step_name': 'Introduction'},
-                    {'step_number': 1, 'delay_days': 7, 'step_name': 'Value Share'},
-                    {'step_number': 2, 'delay_days': 14, 'step_name': 'Case Study'},
-                    {'step_number': 3, 'delay_days': 30, 'step_name': 'Monthly Check-in'},
-                    {'step_number': 4, 'delay_days': 60, 'step_name': 'Final Offer'}
-                ]
-            }
-        ]
-        
-        for config_data in configs:
-            config = EmailSequenceConfig(
-                name=config_data['name'],
-                description=config_data['description'],
-                is_active=True
-            )
-            db.session.add(config)
-            db.session.flush()  # Get ID
-            
-            for step_data in config_data['steps']:
-                step = SequenceStep(
-                    sequence_config_id=config.id,
-                    step_number=step_data['step_number'],
-                    delay_days=step_data['delay_days'],
-                    step_name=step_data['step_name'],
-                    is_active=True
-                )
-                db.session.add(step)
-            
-            self.sequence_configs[config_data['name']] = config
-        
-        print(f"   * Created {len(configs)} sequence configurations")
-    
-    def create_template_library(self):
-        """Create complete template sets for both breached and proactive"""
-        print("Creating email template library...")
-        
-        # Common template variables
-        common_vars = ['{{first_name}}', '{{last_name}}', '{{company}}', '{{industry}}', '{{email}}']
-        breach_vars = common_vars + ['{{breach_name}}', '{{breach_date}}', '{{risk_level}}', '{{records_affected}}', '{{data_types}}']
-        
-        # BREACHED EMAIL TEMPLATES
-        breached_templates = [
-            {
-                'step': 0, 'name': 'Urgent Security Alert - Initial',
-                'subject': 'URGENT: {{company}} data compromised in {{breach_name}} breach',
-                'body': '''Hi {{first_name}},
+from collections import namedtuple
+
+import numpy as np
+from sqlalchemy import insert, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Seed for the seeder's random generators, so seeded data is reproducible
+DEFAULT_SEED = 42
+
+# Lightweight stand-in for the Contact rows later seeding phases read from
+SeededContact = namedtuple('SeededContact', ['id', 'email', 'company'])
+
+# Pools for synthetic contacts when seeding at scale (seed_all(n_contacts=...))
+_FIRST_NAMES = np.array([
+    'John', 'Sarah', 'Mike', 'Lisa', 'Robert', 'Jennifer', 'David', 'Michelle',
+    'James', 'Emily', 'Daniel', 'Laura', 'Kevin', 'Anna', 'Brian', 'Rachel'
+])
+_LAST_NAMES = np.array([
+    'Smith', 'Jones', 'Wilson', 'Davis', 'Brown', 'Martinez', 'Taylor', 'Garcia',
+    'Miller', 'Anderson', 'Thomas', 'Moore', 'Clark', 'Lewis', 'Walker', 'Young'
+])
+_COMPANIES = np.array([
+    'Regional Hospital', 'TechStartup Inc', 'First National Bank', 'City School District',
+    'ABC Manufacturing', 'Martinez & Associates Law', 'Taylor Retail Group', 'Garcia Consulting'
+])
+_COMPANY_DOMAINS = np.array([
+    'regionalhospital.com', 'techstartup.io', 'firstnationalbank.com', 'cityschools.edu',
+    'manufacturer.com', 'lawfirm.com', 'retailstore.com', 'consultingfirm.com'
+])
+_COMPANY_INDUSTRIES = np.array([
+    'Healthcare', 'Technology', 'Finance', 'Education',
+    'Manufacturing', 'Legal', 'Retail', 'Consulting'
+])
+_TITLES = np.array([
+    'IT Director', 'CTO', 'Security Manager', 'IT Administrator',
+    'Operations Manager', 'Managing Partner', 'Store Manager', 'Principal Consultant'
+])
+
+# Template variables (static, shared by every seed run)
+_COMMON_VARS = ('{{first_name}}', '{{last_name}}', '{{company}}', '{{industry}}', '{{email}}')
+_BREACH_VARS = _COMMON_VARS + ('{{breach_name}}', '{{breach_date}}', '{{risk_level}}', '{{records_affected}}', '{{data_types}}')
+
+# BREACHED EMAIL TEMPLATES
+_BREACHED_TEMPLATES = (
+    {
+        'step': 0, 'name': 'Urgent Security Alert - Initial',
+        'subject': 'URGENT: {{company}} data compromised in {{breach_name}} breach',
+        'body': '''Hi {{first_name}},
 
 We discovered that {{company}}'s data was exposed in the recent {{breach_name}} data breach affecting {{records_affected}} records.
 
@@ -131,12 +78,12 @@ Book your free 15-minute consultation: https://calendly.com/security-team
 Best regards,
 Security Team
 SalesBreachPro''',
-                'variables': breach_vars
-            },
-            {
-                'step': 1, 'name': 'Security Follow-up - Day 2',
-                'subject': 'Did you see our security alert about {{company}}?',
-                'body': '''Hi {{first_name}},
+        'variables': _BREACH_VARS
+    },
+    {
+        'step': 1, 'name': 'Security Follow-up - Day 2',
+        'subject': 'Did you see our security alert about {{company}}?',
+        'body': '''Hi {{first_name}},
 
 I wanted to make sure you saw my message about {{company}}'s data exposure in the {{breach_name}} breach.
 
@@ -148,12 +95,12 @@ Quick call link: https://calendly.com/security-team/15min
 
 Best regards,
 Security Team''',
-                'variables': breach_vars
-            },
-            {
-                'step': 2, 'name': 'Security Consultation - Day 5',
-                'subject': 'Quick question about {{company}}\'s data security',
-                'body': '''Hi {{first_name}},
+        'variables': _BREACH_VARS
+    },
+    {
+        'step': 2, 'name': 'Security Consultation - Day 5',
+        'subject': 'Quick question about {{company}}\'s data security',
+        'body': '''Hi {{first_name}},
 
 Just a quick question - have you had a chance to review {{company}}'s exposure in the {{breach_name}} incident?
 
@@ -167,12 +114,12 @@ Would you like me to send over some {{industry}} case studies showing the result
 
 Best regards,
 Security Team''',
-                'variables': breach_vars
-            },
-            {
-                'step': 3, 'name': 'Final Security Offer - Day 12',
-                'subject': 'Final follow-up: {{breach_name}} impact assessment',
-                'body': '''Hi {{first_name}},
+        'variables': _BREACH_VARS
+    },
+    {
+        'step': 3, 'name': 'Final Security Offer - Day 12',
+        'subject': 'Final follow-up: {{breach_name}} impact assessment',
+        'body': '''Hi {{first_name}},
 
 I know {{industry}} leaders are busy, but I wanted to reach out one more time about {{company}}'s exposure in the {{breach_name}} breach.
 
@@ -184,12 +131,12 @@ Otherwise, I'll remove you from this specific security alert sequence.
 
 Best regards,
 Security Team''',
-                'variables': breach_vars
-            },
-            {
-                'step': 4, 'name': 'Archive Notice - Day 26',
-                'subject': 'Archiving {{company}}\'s security file',
-                'body': '''Hi {{first_name}},
+        'variables': _BREACH_VARS
+    },
+    {
+        'step': 4, 'name': 'Archive Notice - Day 26',
+        'subject': 'Archiving {{company}}\'s security file',
+        'body': '''Hi {{first_name}},
 
 I'm archiving {{company}}'s security consultation file since I haven't heard back.
 
@@ -200,16 +147,16 @@ Wishing you and {{company}} continued success.
 Best regards,
 Security Team
 SalesBreachPro''',
-                'variables': breach_vars
-            }
-        ]
-        
-        # PROACTIVE EMAIL TEMPLATES
-        proactive_templates = [
-            {
-                'step': 0, 'name': 'Free Security Assessment - Initial',
-                'subject': 'Complimentary cybersecurity assessment for {{company}}',
-                'body': '''Hi {{first_name}},
+        'variables': _BREACH_VARS
+    }
+)
+
+# PROACTIVE EMAIL TEMPLATES
+_PROACTIVE_TEMPLATES = (
+    {
+        'step': 0, 'name': 'Free Security Assessment - Initial',
+        'subject': 'Complimentary cybersecurity assessment for {{company}}',
+        'body': '''Hi {{first_name}},
 
 {{company}} is exactly the type of {{industry}} company that cyber attackers target most.
 
@@ -225,12 +172,12 @@ Available times this week: https://calendly.com/security-team
 Best regards,
 Security Consultant
 SalesBreachPro''',
-                'variables': common_vars
-            },
-            {
-                'step': 1, 'name': 'Security Value - Day 2',
-                'subject': 'Strengthening {{company}}\'s security posture',
-                'body': '''Hi {{first_name}},
+        'variables': _COMMON_VARS
+    },
+    {
+        'step': 1, 'name': 'Security Value - Day 2',
+        'subject': 'Strengthening {{company}}\'s security posture',
+        'body': '''Hi {{first_name}},
 
 I hope you had a chance to review my message about {{company}}'s cybersecurity assessment.
 
@@ -242,12 +189,12 @@ Quick call: https://calendly.com/security-team/15min
 
 Best regards,
 Security Consultant''',
-                'variables': common_vars
-            },
-            {
-                'step': 2, 'name': 'Security Consultation - Day 5',
-                'subject': '15-minute security consultation for {{company}}?',
-                'body': '''Hi {{first_name}},
+        'variables': _COMMON_VARS
+    },
+    {
+        'step': 2, 'name': 'Security Consultation - Day 5',
+        'subject': '15-minute security consultation for {{company}}?',
+        'body': '''Hi {{first_name}},
 
 I've been researching {{industry}} security trends and noticed that companies like {{company}} face some unique challenges:
 
@@ -261,12 +208,12 @@ Available for a quick 15-minute call this week?
 
 Best regards,
 Security Consultant''',
-                'variables': common_vars
-            },
-            {
-                'step': 3, 'name': 'Industry Insights - Day 12',
-                'subject': 'Industry-specific security insights for {{company}}',
-                'body': '''Hi {{first_name}},
+        'variables': _COMMON_VARS
+    },
+    {
+        'step': 3, 'name': 'Industry Insights - Day 12',
+        'subject': 'Industry-specific security insights for {{company}}',
+        'body': '''Hi {{first_name}},
 
 I just finished a security analysis for another {{industry}} company and thought you might find the insights valuable for {{company}}.
 
@@ -279,12 +226,12 @@ Would you like me to send over the {{industry}} security benchmark report?
 
 Best regards,
 Security Consultant''',
-                'variables': common_vars
-            },
-            {
-                'step': 4, 'name': 'Final Offer - Day 26',
-                'subject': 'Final opportunity: Complimentary security review for {{company}}',
-                'body': '''Hi {{first_name}},
+        'variables': _COMMON_VARS
+    },
+    {
+        'step': 4, 'name': 'Final Offer - Day 26',
+        'subject': 'Final opportunity: Complimentary security review for {{company}}',
+        'body': '''Hi {{first_name}},
 
 This is my final note about the complimentary security assessment for {{company}}.
 
@@ -295,44 +242,189 @@ If you'd like to take advantage of this complimentary assessment, I'm available
 Best regards,
 Security Consultant
 SalesBreachPro''',
-                'variables': common_vars
+        'variables': _COMMON_VARS
+    }
+)
+
+
+class DatabaseSeeder:
+    """Creates realistic dummy data for working system"""
+    
+    # Buffered rows per table before create_email_sequences writes them out
+    flush_threshold = 2000
+    
+    def __init__(self, seed=DEFAULT_SEED):
+        self.sequence_configs = {}
+        self.templates = {}
+        self.campaigns = {}
+        self.contacts = []
+        self._steps_by_config = {}
+        self.n_contacts = None
+        self.session = db.session
+        # Numeric fields are drawn in one vectorized call per phase; both
+        # generators are seeded so every run produces the same data
+        self.rng = np.random.default_rng(seed)
+        self.random = random.Random(seed)
+    
+    def seed_all(self, n_contacts=None):
+        """Seed all data for working system
+        
+        With n_contacts set, that many synthetic contacts are generated and all
+        of them are enrolled, for load and performance testing.
+        """
+        self.n_contacts = n_contacts
+        logger.info("Starting database seeding...")
+        
+        phases = (
+            self.create_sequence_configs,
+            self.create_template_library,
+            self.create_demo_campaigns,
+            self.create_sample_contacts,
+            self.create_email_sequences,
+            self.create_sample_settings
+        )
+        
+        # Check out one connection for the whole run; every phase commits on it
+        with db.engine.connect() as connection:
+            self.session = Session(bind=connection, expire_on_commit=False)
+            try:
+                for phase in phases:
+                    # Each phase flushes explicitly where it needs IDs
+                    with self.session.no_autoflush:
+                        phase()
+                    self._checkpoint()
+            finally:
+                self.session.close()
+                self.session = db.session
+        
+        logger.info("Database seeding completed!")
+        
+        self.print_summary()
+    
+    def _checkpoint(self):
+        """Commit the finished phase and start the next one with an empty session"""
+        self.session.flush()
+        self.session.commit()
+        self.session.expunge_all()
+        
+        # Re-attach the parents later phases navigate relationships from
+        self.sequence_configs = {
+            name: self.session.merge(config, load=False)
+            for name, config in self.sequence_configs.items()
+        }
+        self.campaigns = {
+            name: self.session.merge(campaign, load=False)
+            for name, campaign in self.campaigns.items()
+        }
+    
+    def create_sequence_configs(self):
+        """Create realistic sequence timing configurations"""
+        configs = [
+            {
+                'name': 'Standard Follow-up Sequence',
+                'description': 'Default 5-email sequence with proven timing - most popular choice',
+                'steps': [
+                    {'step_number': 0, 'delay_days': 0, 'step_name': 'Initial Outreach'},
+                    {'step_number': 1, 'delay_days': 2, 'step_name': 'First Follow-up'},
+                    {'step_number': 2, 'delay_days': 5, 'step_name': 'Second Follow-up'},
+                    {'step_number': 3, 'delay_days': 12, 'step_name': 'Third Follow-up'},
+                    {'step_number': 4, 'delay_days': 26, 'step_name': 'Final Follow-up'}
+                ]
+            },
+            {
+                'name': 'Aggressive Follow-up Sequence',
+                'description': 'Fast-paced 7-email sequence for urgent campaigns and high-priority prospects',
+                'steps': [
+                    {'step_number': 0, 'delay_days': 0, 'step_name': 'Urgent Alert'},
+                    {'step_number': 1, 'delay_days': 1, 'step_name': 'Quick Follow-up'},
+                    {'step_number': 2, 'delay_days': 3, 'step_name': 'Persistence Push'},
+                    {'step_number': 3, 'delay_days': 7, 'step_name': 'Week Check-in'},
+                    {'step_number': 4, 'delay_days': 14, 'step_name': 'Final Push'},
+                    {'step_number': 5, 'delay_days': 21, 'step_name': 'Closing Window'},
+                    {'step_number': 6, 'delay_days': 30, 'step_name': 'Archive Notice'}
+                ]
+            },
+            {
+                'name': 'Gentle Nurture Sequence',
+                'description': 'Relationship-building sequence with extended timing for long-term prospects',
+                'steps': [
+                    {'step_number': 0, 'delay_days': 0, 'step_name': 'Introduction'},
+                    {'step_number': 1, 'delay_days': 7, 'step_name': 'Value Share'},
+                    {'step_number': 2, 'delay_days': 14, 'step_name': 'Case Study'},
+                    {'step_number': 3, 'delay_days': 30, 'step_name': 'Monthly Check-in'},
+                    {'step_number': 4, 'delay_days': 60, 'step_name': 'Final Offer'}
+                ]
             }
         ]
         
-        # Create all templates
-        template_count = 0
-        for template_data in breached_templates + proactive_templates:
-            template_type = 'breached' if template_data in breached_templates else 'proactive'
-            
-            template = EmailTemplate(
-                name=template_data['name'],
-                template_type='follow_up' if template_data['step'] > 0 else 'initial',
-                risk_level='high' if template_type == 'breached' else 'generic',
-                sequence_order=template_data['step'] + 1,
-                delay_hours=0,  # Using new sequence system
-                sequence_step=template_data['step'],
-                breach_template_type=template_type,
-                available_variables=template_data['variables'],
-                subject_line=template_data['subject'],
-                subject=template_data['subject'],
-                email_body=template_data['body'],
-                content=template_data['body'],
-                email_body_html=template_data['body'].replace('\n', '<br>'),
-                is_active=True,
-                active=True,
-                created_at=datetime.utcnow(),
-                usage_count=random.randint(5, 50),
-                success_rate=random.uniform(0.15, 0.35)
+        for config_data in configs:
+            config = EmailSequenceConfig(
+                name=config_data['name'],
+                description=config_data['description'],
+                is_active=True
             )
-            db.session.add(template)
-            template_count += 1
+            self.session.add(config)
+            self.sequence_configs[config_data['name']] = config
+        
+        self.session.flush()  # Get config IDs for the steps
+        
+        step_mappings = [
+            {
+                'sequence_config_id': self.sequence_configs[config_data['name']].id,
+                'step_number': step_data['step_number'],
+                'delay_days': step_data['delay_days'],
+                'step_name': step_data['step_name'],
+                'is_active': True
+            }
+            for config_data in configs
+            for step_data in config_data['steps']
+        ]
+        self.session.bulk_insert_mappings(SequenceStep, step_mappings)
+        
+        # Ordered steps per config, so later phases never query them again
+        for step in sorted(step_mappings, key=lambda step: step['step_number']):
+            self._steps_by_config.setdefault(step['sequence_config_id'], []).append(step)
+        
+        logger.info(f"Created {len(configs)} sequence configurations")
+    
+    def create_template_library(self):
+        """Create complete template sets for both breached and proactive"""
+        # Create all templates in a single executemany
+        template_count = len(_BREACHED_TEMPLATES) + len(_PROACTIVE_TEMPLATES)
+        usage_counts = iter(self.rng.integers(5, 51, size=template_count).tolist())
+        success_rates = iter(self.rng.uniform(0.15, 0.35, size=template_count).tolist())
+        
+        now = datetime.utcnow()
+        template_mappings = []
+        for templates, template_type in ((_BREACHED_TEMPLATES, 'breached'), (_PROACTIVE_TEMPLATES, 'proactive')):
+            for template_data in templates:
+                template_mappings.append({
+                    'name': template_data['name'],
+                    'template_type': 'follow_up' if template_data['step'] > 0 else 'initial',
+                    'category': template_type,
+                    'sequence_order': template_data['step'] + 1,
+                    'sequence_step': template_data['step'],
+                    'delay_amount': 0,  # Timing comes from the sequence configs
+                    'delay_unit': 'days',
+                    'available_variables': template_data['variables'],
+                    'subject_line': template_data['subject'],
+                    'subject': template_data['subject'],
+                    'email_body': template_data['body'],
+                    'content': template_data['body'],
+                    # email_body_html stays NULL; senders and previews fall back to email_body
+                    'is_active': True,
+                    'active': True,
+                    'created_at': now,
+                    'usage_count': next(usage_counts),
+                    'success_rate': next(success_rates)
+                })
+        
+        self.session.bulk_insert_mappings(EmailTemplate, template_mappings)
         
-        print(f"   * Created {template_count} email templates")
+        logger.info(f"Created {template_count} email templates")
     
     def create_demo_campaigns(self):
         """Create working campaigns with real configuration"""
-        print("Creating demo campaigns...")
-        
         campaigns_data = [
             {
                 'name': 'Q4 Healthcare Security Outreach',
@@ -341,8 +433,7 @@ SalesBreachPro''',
                 'daily_limit': 25,
                 'active': True,
                 'status': 'active',
-                'auto_enroll': True,
-                'target_risk_levels': ['high', 'medium']
+                'auto_enroll': True
             },
             {
                 'name': 'Financial Services Data Protection',
@@ -351,8 +442,7 @@ SalesBreachPro''',
                 'daily_limit': 15,
                 'active': True,
                 'status': 'active',
-                'auto_enroll': True,
-                'target_risk_levels': ['high']
+                'auto_enroll': True
             },
             {
                 'name': 'SMB General Security Awareness',
@@ -361,8 +451,7 @@ SalesBreachPro''',
                 'daily_limit': 50,
                 'active': False,
                 'status': 'draft',
-                'auto_enroll': False,
-                'target_risk_levels': ['medium', 'low']
+                'auto_enroll': False
             },
             {
                 'name': 'Government Security Initiative',
@@ -371,172 +460,245 @@ SalesBreachPro''',
                 'daily_limit': 10,
                 'active': True,
                 'status': 'active',
-                'auto_enroll': True,
-                'target_risk_levels': ['high', 'medium', 'low']
+                'auto_enroll': True
             }
         ]
         
-        for camp_data in campaigns_data:
+        n = len(campaigns_data)
+        created_offsets = self.rng.integers(5, 61, size=n).tolist()
+        total_contacts = self.rng.integers(50, 301, size=n).tolist()
+        sent_counts = self.rng.integers(20, 151, size=n).tolist()
+        response_counts = self.rng.integers(2, 16, size=n).tolist()
+        enrollment_offsets = self.rng.integers(1, 25, size=n).tolist()
+        
+        now = datetime.utcnow()
+        for i, camp_data in enumerate(campaigns_data):
             sequence_config = self.sequence_configs[camp_data['sequence_config']]
             
             campaign = Campaign(
                 name=camp_data['name'],
                 description=camp_data['description'],
-                template_type='high_risk',
                 status=camp_data['status'],
-                created_at=datetime.utcnow() - timedelta(days=random.randint(5, 60)),
-                total_contacts=random.randint(50, 300),
-                sent_count=random.randint(20, 150),
-                response_count=random.randint(2, 15),
+                created_at=now - timedelta(days=created_offsets[i]),
+                total_contacts=total_contacts[i],
+                sent_count=sent_counts[i],
+                response_count=response_counts[i],
                 active=camp_data['active'],
                 daily_limit=camp_data['daily_limit'],
                 sender_email='security@salesbreachpro.com',
                 sender_name='Security Team',
-                target_risk_levels=camp_data['target_risk_levels'],
                 auto_enroll=camp_data['auto_enroll'],
                 sequence_config_id=sequence_config.id,
-                last_enrollment_check=datetime.utcnow() - timedelta(hours=random.randint(1, 24))
+                last_enrollment_check=now - timedelta(hours=enrollment_offsets[i])
             )
-            db.session.add(campaign)
-            db.session.flush()
+            self.session.add(campaign)
+            self.session.flush()
             self.campaigns[camp_data['name']] = campaign
         
-        print(f"   * Created {len(campaigns_data)} demo campaigns")
+        logger.info(f"Created {len(campaigns_data)} demo campaigns")
     
     def create_sample_contacts(self):
         """Create realistic contacts with various industries"""
-        print("Creating sample contacts...")
-        
         contacts_data = [
             {'email': 'john.smith@regionalhospital.com', 'first_name': 'John', 'last_name': 'Smith', 
-             'company': 'Regional Hospital', 'industry': 'Healthcare', 'title': 'IT Director', 'breach_status': 'high'},
+             'company': 'Regional Hospital', 'industry': 'Healthcare', 'title': 'IT Director'},
             {'email': 'sarah.jones@techstartup.io', 'first_name': 'Sarah', 'last_name': 'Jones',
-             'company': 'TechStartup Inc', 'industry': 'Technology', 'title': 'CTO', 'breach_status': 'medium'},
+             'company': 'TechStartup Inc', 'industry': 'Technology', 'title': 'CTO'},
             {'email': 'mike.wilson@firstnationalbank.com', 'first_name': 'Mike', 'last_name': 'Wilson',
-             'company': 'First National Bank', 'industry': 'Finance', 'title': 'Security Manager', 'breach_status': 'high'},
+             'company': 'First National Bank', 'industry': 'Finance', 'title': 'Security Manager'},
             {'email': 'lisa.davis@cityschools.edu', 'first_name': 'Lisa', 'last_name': 'Davis',
-             'company': 'City School District', 'industry': 'Education', 'title': 'IT Administrator', 'breach_status': 'medium'},
+             'company': 'City School District', 'industry': 'Education', 'title': 'IT Administrator'},
             {'email': 'robert.brown@manufacturer.com', 'first_name': 'Robert', 'last_name': 'Brown',
-             'company': 'ABC Manufacturing', 'industry': 'Manufacturing', 'title': 'Operations Manager', 'breach_status': 'low'},
+             'company': 'ABC Manufacturing', 'industry': 'Manufacturing', 'title': 'Operations Manager'},
             {'email': 'jennifer.martinez@lawfirm.com', 'first_name': 'Jennifer', 'last_name': 'Martinez',
-             'company': 'Martinez & Associates Law', 'industry': 'Legal', 'title': 'Managing Partner', 'breach_status': 'medium'},
+             'company': 'Martinez & Associates Law', 'industry': 'Legal', 'title': 'Managing Partner'},
             {'email': 'david.taylor@retailstore.com', 'first_name': 'David', 'last_name': 'Taylor',
-             'company': 'Taylor Retail Group', 'industry': 'Retail', 'title': 'Store Manager', 'breach_status': 'medium'},
+             'company': 'Taylor Retail Group', 'industry': 'Retail', 'title': 'Store Manager'},
             {'email': 'michelle.garcia@consultingfirm.com', 'first_name': 'Michelle', 'last_name': 'Garcia',
-             'company': 'Garcia Consulting', 'industry': 'Consulting', 'title': 'Principal Consultant', 'breach_status': 'low'},
+             'company': 'Garcia Consulting', 'industry': 'Consulting', 'title': 'Principal Consultant'},
         ]
         
-        for contact_data in contacts_data:
-            domain = contact_data['email'].split('@')[1]
-            contact = Contact(
-                email=contact_data['email'],
-                first_name=contact_data['first_name'],
-                last_name=contact_data['last_name'],
-                company=contact_data['company'],
-                industry=contact_data['industry'],
-                title=contact_data['title'],
-                domain=domain,
-                breach_status=contact_data['breach_status'],
-                created_at=datetime.utcnow() - timedelta(days=random.randint(1, 90)),
-                last_contacted=datetime.utcnow() - timedelta(days=random.randint(1, 30)),
-                is_active=True
-            )
-            db.session.add(contact)
-            self.contacts.append(contact)
+        if self.n_contacts:
+            # Scaled runs draw synthetic contacts instead of the fixed sample set
+            contacts_data = self._generate_contacts_data(self.n_contacts)
+        
+        n = len(contacts_data)
+        created_offsets = self.rng.integers(1, 91, size=n).tolist()
+        contacted_offsets = self.rng.integers(1, 31, size=n).tolist()
         
-        # Flush to get contact IDs
-        db.session.flush()
+        now = datetime.utcnow()
+        rows = [
+            {
+                'email': contact_data['email'],
+                'first_name': contact_data['first_name'],
+                'last_name': contact_data['last_name'],
+                'company': contact_data['company'],
+                'industry': contact_data['industry'],
+                'title': contact_data['title'],
+                'domain': contact_data['email'].split('@')[1],
+                'created_at': now - timedelta(days=created_offsets[i]),
+                'last_contacted': now - timedelta(days=contacted_offsets[i]),
+                'is_active': True
+            }
+            for i, contact_data in enumerate(contacts_data)
+        ]
+        
+        # Bulk INSERT ... RETURNING; later phases only need id and company
+        contact_ids = self.session.scalars(
+            insert(Contact).returning(Contact.id, sort_by_parameter_order=True),
+            rows
+        ).all()
+        self.contacts = [
+            SeededContact(contact_id, row['email'], row['company'])
+            for contact_id, row in zip(contact_ids, rows)
+        ]
+        
+        logger.info(f"Created {len(contacts_data)} sample contacts")
+    
+    def _generate_contacts_data(self, n):
+        """Draw n synthetic contacts from the name and company pools"""
+        first_names = _FIRST_NAMES[self.rng.integers(0, len(_FIRST_NAMES), size=n)].tolist()
+        last_names = _LAST_NAMES[self.rng.integers(0, len(_LAST_NAMES), size=n)].tolist()
+        company_idx = self.rng.integers(0, len(_COMPANIES), size=n)
+        companies = _COMPANIES[company_idx].tolist()
+        domains = _COMPANY_DOMAINS[company_idx].tolist()
+        industries = _COMPANY_INDUSTRIES[company_idx].tolist()
+        titles = _TITLES[self.rng.integers(0, len(_TITLES), size=n)].tolist()
         
-        print(f"   * Created {len(contacts_data)} sample contacts")
+        return [
+            {
+                # The running index keeps generated addresses unique
+                'email': f'{first_name.lower()}.{last_name.lower()}{i}@{domain}',
+                'first_name': first_name,
+                'last_name': last_name,
+                'company': company,
+                'industry': industry,
+                'title': title
+            }
+            for i, (first_name, last_name, company, domain, industry, title) in enumerate(
+                zip(first_names, last_names, companies, domains, industries, titles)
+            )
+        ]
     
     def create_email_sequences(self):
         """Create realistic email sequences showing contacts at different stages"""
-        print("Creating email sequences...")
+        # First 6 contacts, or every generated contact in a scaled run
+        contacts = self.contacts if self.n_contacts else self.contacts[:6]
+        campaigns = list(self.campaigns.values())[:3]  # First 3 campaigns
+        
+        n = len(contacts) * len(campaigns)
+        current_steps = iter(self.rng.integers(0, 5, size=n).tolist())
+        created_offsets = iter(self.rng.integers(5, 31, size=n).tolist())
+        start_offsets = iter(self.rng.integers(10, 61, size=n).tolist())
+        
+        # At most current_sequence_step + 1 (<= 5) sent emails per enrollment
+        max_sent = n * 5
+        send_hours = iter(self.rng.integers(9, 18, size=max_sent).tolist())
+        send_minutes = iter(self.rng.integers(0, 60, size=max_sent).tolist())
+        delivery_minutes = iter(self.rng.integers(1, 11, size=max_sent).tolist())
+        open_hours = iter(self.rng.integers(1, 49, size=max_sent).tolist())
+        click_hours = iter(self.rng.integers(2, 73, size=max_sent).tolist())
+        opened = iter((self.rng.random(max_sent) < 0.6).tolist())
+        clicked = iter((self.rng.random(max_sent) < 0.2).tolist())
+        
+        now = datetime.utcnow()
+        today = now.date()
         
+        batch = {'statuses': [], 'emails': [], 'email_sequences': [], 'sequences': []}
         sequence_count = 0
         email_count = 0
         
-        # Create sequences for some contacts in campaigns
-        for contact in self.contacts[:6]:  # First 6 contacts
-            for campaign_name, campaign in list(self.campaigns.items())[:3]:  # First 3 campaigns
+        for contact in contacts:
+            for campaign in campaigns:
                 
                 # Skip some combinations to make it realistic
-                if random.random() < 0.4:
+                if self.random.random() < 0.4:
                     continue
                 
-                # Determine breach status and template type
-                template_type = 'breached' if contact.breach_status == 'high' else 'proactive'
+                current_step = next(current_steps)
+                batch['statuses'].append({
+                    'contact_id': contact.id,
+                    'campaign_id': campaign.id,
+                    'current_sequence_step': current_step,
+                    'created_at': now - timedelta(days=next(created_offsets))
+                })
                 
-                # Create contact campaign status
-                status = ContactCampaignStatus(
-                    contact_id=contact.id,
-                    campaign_id=campaign.id,
-                    breach_status='breached' if template_type == 'breached' else 'clean',
-                    current_sequence_step=random.randint(0, 4),
-                    flawtrack_checked_at=datetime.utcnow() - timedelta(days=random.randint(1, 7)),
-                    breach_data={'status': template_type, 'checked': True} if template_type == 'breached' else None,
-                    created_at=datetime.utcnow() - timedelta(days=random.randint(5, 30))
-                )
-                db.session.add(status)
-                db.session.flush()
-                
-                # Create email sequences for this contact
-                sequence_config = self.sequence_configs[campaign.sequence_config_ref.name]
-                steps = sequence_config.steps.order_by(SequenceStep.step_number).all()
-                
-                start_date = datetime.utcnow().date() - timedelta(days=random.randint(10, 60))
+                steps = self._steps_by_config[campaign.sequence_config_id]
+                start_date = today - timedelta(days=next(start_offsets))
                 
                 for step in steps:
-                    if step.step_number > status.current_sequence_step:
-                        # Future emails
-                        scheduled_date = start_date + timedelta(days=step.delay_days)
-                        email_status = 'scheduled'
-                        sent_at = None
-                    else:
+                    step_number = step['step_number']
+                    scheduled_date = start_date + timedelta(days=step['delay_days'])
+                    sequence_row = {
+                        'contact_id': contact.id,
+                        'campaign_id': campaign.id,
+                        'sequence_step': step_number,
+                        'scheduled_date': scheduled_date,
+                        'sent_at': None,
+                        'status': 'scheduled',
+                        'email_id': None
+                    }
+                    
+                    if step_number <= current_step:
                         # Past emails
-                        scheduled_date = start_date + timedelta(days=step.delay_days)
-                        email_status = 'sent'
-                        sent_at = datetime.combine(scheduled_date, datetime.min.time()) + timedelta(
-                            hours=random.randint(9, 17), minutes=random.randint(0, 59)
+                        sent_at = datetime(
+                            scheduled_date.year, scheduled_date.month, scheduled_date.day,
+                            next(send_hours), next(send_minutes)
                         )
-                        
-                        # Create actual email record
-                        email = Email(
-                            contact_id=contact.id,
-                            campaign_id=campaign.id,
-                            email_type=f'step_{step.step_number}',
-                            subject=f'Security consultation for {contact.company} - Step {step.step_number}',
-                            body='Sample email content',
-                            status='sent',
-                            sent_at=sent_at,
-                            delivered_at=sent_at + timedelta(minutes=random.randint(1, 10)),
-                            opened_at=sent_at + timedelta(hours=random.randint(1, 48)) if random.random() < 0.6 else None,
-                            clicked_at=sent_at + timedelta(hours=random.randint(2, 72)) if random.random() < 0.2 else None
-                        )
-                        db.session.add(email)
-                        db.session.flush()
+                        batch['emails'].append({
+                            'contact_id': contact.id,
+                            'campaign_id': campaign.id,
+                            'email_type': f'step_{step_number}',
+                            'subject': f'Security consultation for {contact.company} - Step {step_number}',
+                            'body': 'Sample email content',
+                            'status': 'sent',
+                            'sent_at': sent_at,
+                            'delivered_at': sent_at + timedelta(minutes=next(delivery_minutes)),
+                            'opened_at': sent_at + timedelta(hours=next(open_hours)) if next(opened) else None,
+                            'clicked_at': sent_at + timedelta(hours=next(click_hours)) if next(clicked) else None
+                        })
+                        # email_id is filled in when the emails are written
+                        batch['email_sequences'].append(sequence_row)
+                        sequence_row['sent_at'] = sent_at
+                        sequence_row['status'] = 'sent'
                         email_count += 1
                     
-                    # Create sequence record
-                    sequence = EmailSequence(
-                        contact_id=contact.id,
-                        campaign_id=campaign.id,
-                        sequence_step=step.step_number,
-                        template_type=template_type,
-                        scheduled_date=scheduled_date,
-                        sent_at=sent_at,
-                        status=email_status,
-                        email_id=email.id if email_status == 'sent' else None
-                    )
-                    db.session.add(sequence)
+                    batch['sequences'].append(sequence_row)
                     sequence_count += 1
+                
+                self._maybe_flush(batch)
+        
+        self._drain(batch)
         
-        print(f"   * Created {sequence_count} email sequences and {email_count} emails")
+        logger.info(f"Created {sequence_count} email sequences and {email_count} emails")
+    
+    def _maybe_flush(self, batch):
+        """Write out the buffered rows once any buffer reaches the flush threshold"""
+        if max(len(rows) for rows in batch.values()) >= self.flush_threshold:
+            self._drain(batch)
+    
+    def _drain(self, batch):
+        """Insert buffered rows parents first, so every foreign key already exists"""
+        if batch['statuses']:
+            self.session.execute(insert(ContactCampaignStatus), batch['statuses'])
+        
+        if batch['emails']:
+            # One multi-row INSERT ... RETURNING; ids come back in parameter order
+            email_ids = self.session.scalars(
+                insert(Email).returning(Email.id, sort_by_parameter_order=True),
+                batch['emails']
+            ).all()
+            for sequence_row, email_id in zip(batch['email_sequences'], email_ids):
+                sequence_row['email_id'] = email_id
+        
+        if batch['sequences']:
+            self.session.execute(insert(EmailSequence), batch['sequences'])
+        
+        for rows in batch.values():
+            rows.clear()
     
     def create_sample_settings(self):
         """Create sample application settings"""
-        print("Creating application settings...")
-        
         settings = [
             ('brevo_api_key', '', 'Brevo API key for email sending'),
             ('sender_email', 'security@salesbreachpro.com', 'Default sender email address'),
@@ -546,35 +708,63 @@ SalesBreachPro''',
             ('flawtrack_api_key', '', 'FlawTrack API key for breach checking')
         ]
         
-        for key, value, description in settings:
-            Settings.set_setting(key, value, description)
+        now = datetime.utcnow()
+        rows = [
+            {'key': key, 'value': value, 'description': description, 'created_at': now, 'updated_at': now}
+            for key, value, description in settings
+        ]
         
-        print(f"   * Created {len(settings)} application settings")
+        # One INSERT ... ON CONFLICT(key) DO UPDATE instead of a SELECT and write per key
+        stmt = sqlite_insert(Settings).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Settings.key],
+            set_={
+                'value': stmt.excluded.value,
+                'description': stmt.excluded.description,
+                'updated_at': stmt.excluded.updated_at
+            }
+        )
+        self.session.execute(stmt)
+        
+        logger.info(f"Created {len(settings)} application settings")
     
     def print_summary(self):
-        """Print a summary of what was created"""
-        print("\n" + "="*60)
-        print("DATABASE SEEDING SUMMARY")
-        print("="*60)
-        print(f"📅 Email Sequence Configurations: {len(self.sequence_configs)}")
-        print(f"📝 Email Templates: {EmailTemplate.query.count()}")
-        print(f"📈 Demo Campaigns: {len(self.campaigns)}")
-        print(f"👥 Sample Contacts: {len(self.contacts)}")
-        print(f"📧 Email Sequences: {EmailSequence.query.count()}")
-        print(f"📨 Sample Emails: {Email.query.count()}")
-        print(f"⚙️ Application Settings: {Settings.query.count()}")
-        print("\n🚀 Ready for UI testing - everything should work with real data!")
-        print("="*60)
-
-
-def seed_database():
+        """Log a summary of what was created"""
+        # One round trip for all table counts
+        template_count, sequence_count, email_count, settings_count = self.session.execute(text(
+            "SELECT (SELECT count(*) FROM email_templates), "
+            "(SELECT count(*) FROM email_sequences), "
+            "(SELECT count(*) FROM emails), "
+            "(SELECT count(*) FROM settings)"
+        )).one()
+        
+        lines = [
+            "=" * 60,
+            "DATABASE SEEDING SUMMARY",
+            "=" * 60,
+            f"📅 Email Sequence Configurations: {len(self.sequence_configs)}",
+            f"📝 Email Templates: {template_count}",
+            f"📈 Demo Campaigns: {len(self.campaigns)}",
+            f"👥 Sample Contacts: {len(self.contacts)}",
+            f"📧 Email Sequences: {sequence_count}",
+            f"📨 Sample Emails: {email_count}",
+            f"⚙️ Application Settings: {settings_count}",
+            "",
+            "🚀 Ready for UI testing - everything should work with real data!",
+            "=" * 60
+        ]
+        logger.info("\n" + "\n".join(lines))
+
+
+def seed_database(n_contacts=None):
     """Main function to seed database"""
     seeder = DatabaseSeeder()
-    seeder.seed_all()
+    seeder.seed_all(n_contacts=n_contacts)
 
 
 if __name__ == "__main__":
     # Run seeder standalone
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     from app import create_app
     app = create_app()
     with app.app_context():
@@ -0,0 +1,15 @@
+"""
+JSON helpers for SalesBreachPro
+orjson-backed parsing and serialization shared by models and API clients
+"""
+import orjson
+
+
+def loads(content):
+    """Parse JSON from bytes or str"""
+    return orjson.loads(content)
+
+
+def dumps(value) -> str:
+    """Serialize a value to a JSON string, stringifying non-str dict keys like json.dumps"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
@@ -1,38 +1,237 @@
 """
 Pagination utilities for SalesBreachPro
+
+OFFSET pagination makes the database walk every skipped row, so the cost of a
+page grows with its depth and ?page=1000000 is an easy way to pin the server.
+Offset pages are therefore capped at PAGINATION_MAX_OFFSET rows (default
+10000, from the app config); deeper requests raise PaginationTooDeepError.
+Below the cap, paginate() switches deep pages to a late row lookup: the offset
+is walked over primary keys only and full rows are loaded for one page.
+Page sizes are clamped to [1, PAGINATION_MAX_PER_PAGE] (default 200).
+Both limits are read at call time, so values from .env loaded by create_app() apply.
 """
+import os
+import sqlite3
+
+from flask import current_app, has_app_context
+from sqlalchemy import func, inspect, select
+
+# Offsets past this use a late row lookup in paginate()
+LATE_ROW_LOOKUP_OFFSET = 1000
+
+
+def _get_limit(name, default):
+    """Pagination limit from the app config, or the environment outside an app context"""
+    if has_app_context():
+        return int(current_app.config.get(name, default))
+    return int(os.getenv(name, default))
+
+
+def get_max_offset():
+    """Deepest row offset served by offset pagination"""
+    return _get_limit('PAGINATION_MAX_OFFSET', 10000)
+
+
+def get_max_per_page():
+    """Largest page size served"""
+    return _get_limit('PAGINATION_MAX_PER_PAGE', 200)
+
+
+def clamp_per_page(per_page):
+    """Keep a page size inside [1, PAGINATION_MAX_PER_PAGE]"""
+    return max(1, min(int(per_page), get_max_per_page()))
+
+
+class PaginationTooDeepError(ValueError):
+    """Requested page lies beyond the offset pagination cap"""
+
+    def __init__(self, page, per_page):
+        self.page = page
+        self.per_page = per_page
+        super().__init__(
+            f"Page {page} is too deep for offset pagination "
+            f"(offset {(page - 1) * per_page} exceeds the {get_max_offset()}-row limit)"
+        )
+
+
+def check_page_depth(page, per_page):
+    """Raise PaginationTooDeepError if page would skip more than the offset cap"""
+    if (page - 1) * per_page > get_max_offset():
+        raise PaginationTooDeepError(page, per_page)
 
 
 class SimplePagination:
-    """Simple pagination object for templates"""
+    """Simple pagination object for templates
+
+    Pass max_offset for offset-queried pages so pages (and the page links)
+    stop at the deepest page paginate() will serve; in-memory lists omit it.
 
-    def __init__(self, items, total, page, per_page):
+    items is read-only once the object is built: templates only iterate it,
+    and views that reshape rows build a new SimplePagination rather than
+    reassigning items. That lets SimplePagination.EMPTY be shared safely.
+    """
+
+    __slots__ = ('items', 'total', 'page', 'per_page', 'pages',
+                 'has_prev', 'has_next', 'prev_num', 'next_num', '_page_window')
+
+    def __init__(self, items, total, page, per_page, max_offset=None):
+        # Malformed query strings must not divide by zero or ask for a million rows
+        per_page = clamp_per_page(per_page)
+        page = max(int(page), 1)
+        self._page_window = None
         self.items = items
         self.total = total
-        self.total_count = total  # Alias for template compatibility
-        self.page = page
-        self.current_page = page  # Alias for template compatibility
         self.per_page = per_page
         self.pages = (total + per_page - 1) // per_page if total > 0 else 1
-        self.total_pages = self.pages  # Alias for template compatibility
+        if max_offset is not None:
+            self.pages = min(self.pages, max_offset // per_page + 1)
+        # items were fetched for this page, so keep it even past the end;
+        # "previous" then leads back to the last real page
+        self.page = page
         self.has_prev = page > 1
         self.has_next = page < self.pages
-        self.prev_num = page - 1 if page > 1 else None
+        self.prev_num = min(page - 1, self.pages) if page > 1 else None
         self.next_num = page + 1 if page < self.pages else None
 
+    # Aliases for template compatibility
+    @property
+    def total_count(self):
+        return self.total
+
+    @property
+    def current_page(self):
+        return self.page
+
+    @property
+    def total_pages(self):
+        return self.pages
+
+    @property
+    def page_window(self):
+        """
+        Page numbers for the paginator, computed once
+
+        Page 10 of 20 gives (1, 2, None, 8, 9, 10, 11, 12, 13, None, 19, 20).
+        """
+        if self._page_window is None:
+            self._page_window = self.iter_window()
+        return self._page_window
+
+    def iter_window(self, left_edge=2, left_current=2, right_current=3, right_edge=2):
+        """
+        Page numbers around the current page, with None marking skipped ranges
+
+        Same layout as Flask-SQLAlchemy 3.x iter_pages(): left_edge pages at
+        the start, left_current before and right_current after the current
+        page, right_edge at the end.
+        """
+        pages = self.pages
+        current = min(self.page, pages)
+        window = list(range(1, min(1 + left_edge, pages + 1)))
+        left_end = len(window) + 1
+        if left_end > pages:
+            return tuple(window)
+
+        mid_start = max(left_end, current - left_current)
+        mid_end = min(current + right_current + 1, pages + 1)
+        if mid_start > left_end:
+            window.append(None)
+        window.extend(range(mid_start, mid_end))
+        if mid_end > pages:
+            return tuple(window)
+
+        right_start = max(mid_end, pages - right_edge + 1)
+        if right_start > mid_end:
+            window.append(None)
+        window.extend(range(right_start, pages + 1))
+        return tuple(window)
+
+
+def _build_empty_pagination():
+    """Empty page built field by field, so importing this module reads no limits"""
+    empty = SimplePagination.__new__(SimplePagination)
+    empty._page_window = None
+    empty.items = ()
+    empty.total = 0
+    empty.page = 1
+    empty.per_page = 1
+    empty.pages = 1
+    empty.has_prev = False
+    empty.has_next = False
+    empty.prev_num = None
+    empty.next_num = None
+    return empty
+
+
+# Shared instance for error paths and empty listings; the tuple keeps its items immutable
+SimplePagination.EMPTY = _build_empty_pagination()
+
+
+def empty_pagination():
+    """Return the shared empty pagination"""
+    return SimplePagination.EMPTY
+
+
+def _supports_window_functions(query):
+    """COUNT(*) OVER () needs SQLite 3.25+; other supported databases have it"""
+    dialect = query.session.get_bind().dialect
+    if dialect.name == 'sqlite':
+        return sqlite3.sqlite_version_info >= (3, 25, 0)
+    return True
+
+
+def paginate(query, page, per_page):
+    """
+    Fetch one page of an ordered SQLAlchemy query together with its total
+
+    The total comes from COUNT(*) OVER () on the page rows, so one round trip
+    replaces the usual query.count() plus offset/limit pair.
+    Raises PaginationTooDeepError past the offset cap.
+    """
+    page = max(page, 1)
+    per_page = clamp_per_page(per_page)
+    check_page_depth(page, per_page)
+    offset = (page - 1) * per_page
+
+    if offset > LATE_ROW_LOOKUP_OFFSET and len(query.column_descriptions) == 1:
+        return _paginate_late_lookup(query, page, per_page, offset)
+
+    if not _supports_window_functions(query):
+        total = query.order_by(None).count()
+        items = query.offset(offset).limit(per_page).all()
+        return SimplePagination(items, total, page, per_page, get_max_offset())
+
+    single_entity = len(query.column_descriptions) == 1
+    rows = query.add_columns(func.count().over().label('_total')).offset(offset).limit(per_page).all()
+
+    if rows:
+        total = rows[0][-1]
+        items = [row[0] if single_entity else tuple(row[:-1]) for row in rows]
+    else:
+        # Past the last page there is no row to carry the total
+        total = query.order_by(None).count() if page > 1 else 0
+        items = []
+
+    return SimplePagination(items, total, page, per_page, get_max_offset())
+
+
+def _paginate_late_lookup(query, page, per_page, offset):
+    """
+    Deep page of a single-entity query via a late row lookup
+
+    Runs WHERE pk IN (SELECT pk ... ORDER BY ... LIMIT per_page OFFSET n), so
+    the skipped rows are read from the narrow primary key projection and only
+    per_page full rows are loaded. The outer query keeps the original ordering.
+    """
+    entity = query.column_descriptions[0]['entity']
+    mapper = inspect(entity, raiseerr=False) if entity is not None else None
+    if mapper is None or len(mapper.primary_key) != 1:
+        total = query.order_by(None).count()
+        items = query.offset(offset).limit(per_page).all()
+        return SimplePagination(items, total, page, per_page, get_max_offset())
 
-class MockPagination:
-    """Mock pagination object for error cases"""
-
-    def __init__(self):
-        self.items = []
-        self.pages = 0
-        self.total_pages = 0  # Add total_pages for template compatibility
-        self.total = 0
-        self.total_count = 0  # Add total_count for template compatibility
-        self.page = 1
-        self.current_page = 1
-        self.has_prev = False
-        self.has_next = False
-        self.prev_num = None
-        self.next_num = None
\ No newline at end of file
+    pk = mapper.primary_key[0]
+    page_ids = query.with_entities(pk).offset(offset).limit(per_page).subquery()
+    items = query.filter(pk.in_(select(page_ids.c[0]))).all()
+    total = query.order_by(None).count()
+    return SimplePagination(items, total, page, per_page, get_max_offset())